@@ -4,12 +4,11 @@ Contains Browser-Use Agent creation and execution logic with session pooling.
 """
 
 import asyncio
-import glob
 import os
 import platform
 import tempfile
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
 
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.outputs import LLMResult
@@ -19,6 +18,92 @@ from ..schemas.actions import ActionResult
 from ..schemas.browser_output import BrowserOutput, FileDetail
 from ..tools.browser import load_browser_tools
 
+DOWNLOAD_DIR_PREFIX = "browser-use-downloads-"
+MAX_SCAN_WORKERS = 8
+
+
+def _walk_files(root: str) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield regular files under a directory using os.scandir.
+
+    File types come from the directory listing itself and symlinks are not
+    followed, so the only per-file syscall left is the size lookup.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        DirEntry for each regular file found
+    """
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+                except OSError:
+                    continue
+
+
+def _scan_download_dir(download_dir: str) -> List[FileDetail]:
+    """
+    Collect file details for a single download directory.
+
+    Args:
+        download_dir: Directory to scan
+
+    Returns:
+        FileDetail for each readable file in the directory tree
+    """
+    details = []
+    for entry in _walk_files(download_dir):
+        try:
+            size = entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+        details.append(
+            FileDetail(path=os.path.abspath(entry.path), name=entry.name, size=size)
+        )
+    return details
+
+
+def _scan_downloads() -> List[FileDetail]:
+    """
+    Collect files saved to Browser-Use download directories.
+
+    Blocking filesystem work; run it in a worker thread from async code.
+    Multiple download directories are scanned concurrently.
+
+    Returns:
+        FileDetail for each file found
+    """
+    try:
+        with os.scandir(tempfile.gettempdir()) as entries:
+            download_dirs = [
+                entry.path
+                for entry in entries
+                if entry.name.startswith(DOWNLOAD_DIR_PREFIX)
+                and entry.is_dir(follow_symlinks=False)
+            ]
+    except OSError:
+        download_dirs = []
+
+    if len(download_dirs) > 1:
+        workers = min(MAX_SCAN_WORKERS, len(download_dirs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            per_dir = list(executor.map(_scan_download_dir, download_dirs))
+    else:
+        per_dir = [_scan_download_dir(d) for d in download_dirs]
+
+    return [detail for details in per_dir for detail in details]
+
 
 class BrowserSessionPool:
     """
@@ -265,6 +350,12 @@ class BrowserAgent:
         except ImportError:
             return False
 
+    async def close(self) -> None:
+        """
+        Kill the warm browser sessions kept for reuse between tasks.
+        """
+        await BrowserSessionPool.clear()
+
     async def execute_task(
         self, task: str, url: Optional[str] = None, context: dict = None
     ) -> ActionResult:
@@ -338,7 +429,9 @@ class BrowserAgent:
                     for action in agent_output.actions:
                         action_name = action.__class__.__name__
                         action_dict = (
-                            action.model_dump() if hasattr(action, "model_dump") else {}
+                            action.model_dump(exclude_none=True)
+                            if hasattr(action, "model_dump")
+                            else {}
                         )
 
                         tool_id = dashboard.log_tool_start(
@@ -413,8 +506,6 @@ class BrowserAgent:
             )
             full_task = tool_context + "\n\n" + task
 
-            temp_dir = Path(tempfile.mkdtemp(prefix="browser_agent_"))
-
             browser_session = await BrowserSessionPool.acquire(
                 self._create_browser_session
             )
@@ -451,6 +542,8 @@ class BrowserAgent:
                     usage["completion_tokens"],
                 )
 
+            scan_task = asyncio.create_task(asyncio.to_thread(_scan_downloads))
+
             try:
                 await BrowserSessionPool.release(browser_session, force_kill=False)
             except Exception:
@@ -460,47 +553,30 @@ class BrowserAgent:
                     pass
             finally:
                 dashboard.set_browser_session(active=False)
-                if self.has_image_gen and task_id:
-                    from pilot.tools.browser.image_tools import (
-                        cleanup_task_images,
-                    )
-
-                    cleanup_task_images()
-
-            downloaded_files = []
-            file_details = []
-
-            download_dirs = glob.glob(
-                str(Path(tempfile.gettempdir()) / "browser-use-downloads-*")
-            )
-            for download_dir in download_dirs:
-                for file_path in Path(download_dir).rglob("*"):
-                    if file_path.is_file():
-                        downloaded_files.append(str(file_path.absolute()))
-                        file_details.append(
-                            FileDetail(
-                                path=str(file_path.absolute()),
-                                name=file_path.name,
-                                size=file_path.stat().st_size,
-                            )
+                try:
+                    if self.has_image_gen and task_id:
+                        from pilot.tools.browser.image_tools import (
+                            cleanup_task_images,
                         )
 
+                        cleanup_task_images()
+                finally:
+                    file_details = await scan_task
+
             browser_output = BrowserOutput(
                 text=result.final_result() or "Task completed",
-                files=downloaded_files,
                 file_details=file_details,
-                work_directory=str(temp_dir),
             )
+            output_data = browser_output.model_dump()
 
             is_successful = result.is_successful()
-            has_errors = bool(result.errors())
+            errors = result.errors()
+            has_errors = bool(errors)
 
             if result.is_done():
                 success = is_successful if is_successful is not None else not has_errors
                 error_msg = (
-                    "; ".join(str(e) for e in result.errors() if e)
-                    if has_errors
-                    else None
+                    "; ".join([str(e) for e in errors if e]) if has_errors else None
                 )
 
                 return ActionResult(
@@ -509,7 +585,7 @@ class BrowserAgent:
                     method_used="browser",
                     confidence=1.0 if success else 0.0,
                     error=error_msg,
-                    data=browser_output.model_dump(),
+                    data=output_data,
                 )
 
             return ActionResult(
@@ -520,7 +596,7 @@ class BrowserAgent:
                 error=(
                     "Agent reached max steps without completing" if has_errors else None
                 ),
-                data=browser_output.model_dump(),
+                data=output_data,
             )
 
         except Exception as e:
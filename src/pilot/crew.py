@@ -4,6 +4,8 @@ import asyncio
 import hashlib
 import os
 import time
+import traceback
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -17,13 +19,20 @@ from .schemas import TaskExecutionResult
 from .services.state import get_app_state
 from .services.crew import (
     CrewAgentFactory,
+    CrewExecutor,
     CrewGuiDelegate,
     CrewToolsFactory,
+    KickoffBusyError,
     LLMEventService,
 )
 from .tools.platform_registry import PlatformToolRegistry
-from .utils.logging import debug_log, update_crew_token_usage
+from .utils.logging import (
+    debug_log,
+    extract_result_token_usage,
+    update_crew_token_usage,
+)
 from .utils.platform import PlatformHelper
+from .utils.threading.main_thread import set_main_event_loop
 from .utils.validation import CoordinateValidator
 from .utils.ui import (
     ActionType,
@@ -32,6 +41,11 @@ from .utils.ui import (
     print_success,
 )
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 AGENT_DISPLAY_NAMES = {
     "Task Orchestration Manager": "Manager",
     "Web Automation Specialist": "Browser Agent",
@@ -41,6 +55,36 @@ AGENT_DISPLAY_NAMES = {
 }
 
 
+MANAGER_TASK_INSTRUCTIONS = """Understand what the user wants to achieve (USER REQUEST below), then delegate to the appropriate specialist.
+
+CRITICAL:
+- Use any provided SYSTEM STATE context verbatim when delegating.
+- Pass EXACT file paths/URLs between agents (never paraphrase)
+- Browser tasks = ONE delegation (session continuity)
+
+FAILURE DETECTION (CHECK FIRST):
+Before claiming success, scan delegation output for these error indicators:
+- "error", "Error", "failed", "Failed", "exception"
+- "No elements found", "not found", "unable to"
+- "could not", "couldn't", "Failed to parse"
+- Tool call errors or exceptions
+If ANY error indicator is present → report FAILURE with the actual error message.
+
+VERIFICATION REQUIREMENT:
+- You MUST verify outcomes with CONCRETE evidence from tool outputs
+- If specialist returns error = TASK FAILED (report the error)
+- NEVER claim success without specific tool output proving the action was completed
+- If task failed, report FAILURE honestly - do not fabricate success"""
+
+
+@lru_cache(maxsize=None)
+def _load_yaml_config(filename: str) -> Dict[str, Any]:
+    """Parse a bundled YAML config once per process and share the result."""
+    config_path = Path(__file__).parent / "config" / filename
+    with open(config_path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 class ComputerUseCrew:
     """
     CrewAI-powered computer automation system.
@@ -85,7 +129,7 @@ class ComputerUseCrew:
         self.vision_llm = vision_llm_client or LLMConfig.get_vision_llm()
         self.browser_llm = browser_llm_client or LLMConfig.get_browser_llm()
 
-        self.agents_config = self._load_yaml_config("agents.yaml")
+        self.agents_config = _load_yaml_config("agents.yaml")
         self.platform_context = PlatformHelper.get_platform_context_string()
 
         self.tool_registry = self._initialize_tool_registry()
@@ -99,16 +143,13 @@ class ComputerUseCrew:
         self.web_automation_tool = self._initialize_web_tool()
         self.coding_automation_tool = self._initialize_coding_tool()
         self.execute_command_tool = self._initialize_system_tool()
+        self.tool_map = self._build_tool_map()
 
         self.crew: Optional[Crew] = None
         self._cached_agents: Optional[Dict[str, Agent]] = None
+        self._cached_agents_sources: tuple = ()
         self._last_token_update: float = 0
 
-    def _load_yaml_config(self, filename: str) -> Dict[str, Any]:
-        config_path = Path(__file__).parent / "config" / filename
-        with open(config_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
-
     def _initialize_tool_registry(self) -> PlatformToolRegistry:
         coordinate_validator = CoordinateValidator(
             self.capabilities.screen_resolution[0],
@@ -325,7 +366,7 @@ class ComputerUseCrew:
 
     def _create_crewai_agents(self) -> Dict[str, Agent]:
         """Create all CrewAI agents for the hierarchical crew."""
-        tool_map = self._build_tool_map()
+        tool_map = self.tool_map
 
         browser_tools = self.agents_config["browser_agent"].get("tools", [])
         gui_tools = self.agents_config["gui_agent"].get("tools", [])
@@ -353,12 +394,27 @@ class ComputerUseCrew:
     def _get_or_create_agents(self) -> Dict[str, Agent]:
         """
         Get cached agents or create new ones if not cached.
-        Reuses agents across task executions for better performance.
+        Reuses agents across task executions and rebuilds them only when
+        the LLM clients or tool registry have been swapped out. Each task
+        still gets a fresh Crew and manager Task.
         """
-        if self._cached_agents is None:
+        sources = (self.llm, self.vision_llm, self.tool_registry)
+        if self._cached_agents is None or any(
+            new is not old for new, old in zip(sources, self._cached_agents_sources)
+        ):
             self._cached_agents = self._create_crewai_agents()
+            self._cached_agents_sources = sources
         return self._cached_agents
 
+    def prepare_agents(self) -> None:
+        """Build the CrewAI agents ahead of the first task."""
+        self._get_or_create_agents()
+
+    async def close(self) -> None:
+        """Release the kickoff thread pool and warm browser sessions."""
+        CrewExecutor.shutdown()
+        await self.browser_agent.close()
+
     def clear_agent_cache(self) -> None:
         """Clear cached agents to force recreation on next task."""
         self._cached_agents = None
@@ -370,28 +426,7 @@ class ComputerUseCrew:
             task_description = f"{task}{context_str}"
 
         return Task(
-            description=f"""USER REQUEST: {task_description}
-
-Understand what the user wants to achieve, then delegate to the appropriate specialist.
-
-CRITICAL:
-- Use any provided SYSTEM STATE context verbatim when delegating.
-- Pass EXACT file paths/URLs between agents (never paraphrase)
-- Browser tasks = ONE delegation (session continuity)
-
-FAILURE DETECTION (CHECK FIRST):
-Before claiming success, scan delegation output for these error indicators:
-- "error", "Error", "failed", "Failed", "exception"
-- "No elements found", "not found", "unable to"
-- "could not", "couldn't", "Failed to parse"
-- Tool call errors or exceptions
-If ANY error indicator is present → report FAILURE with the actual error message.
-
-VERIFICATION REQUIREMENT:
-- You MUST verify outcomes with CONCRETE evidence from tool outputs
-- If specialist returns error = TASK FAILED (report the error)
-- NEVER claim success without specific tool output proving the action was completed
-- If task failed, report FAILURE honestly - do not fabricate success""",
+            description=f"{MANAGER_TASK_INSTRUCTIONS}\n\nUSER REQUEST: {task_description}",
             expected_output="""FIRST: Scan delegation output for errors. If errors found, report FAILURE.
 
 A) FAILURE (if ANY errors in output):
@@ -438,6 +473,9 @@ B) SUCCESS (ONLY if zero errors AND positive evidence):
 
         self._setup_llm_event_handlers()
 
+        # A kickoff cancelled with ESC may still be driving the cached agents.
+        if CrewExecutor.has_active_kickoffs():
+            self.clear_agent_cache()
         agents_dict = self._get_or_create_agents()
         system_state_context = ""
         try:
@@ -475,7 +513,7 @@ B) SUCCESS (ONLY if zero errors AND positive evidence):
             verbose=dashboard.is_verbose,
         )
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
             t0 = time.time()
             debug_log(
@@ -484,7 +522,7 @@ B) SUCCESS (ONLY if zero errors AND positive evidence):
                 "Calling CrewAI kickoff in executor",
                 {"executor_loop_running": bool(loop.is_running())},
             )
-            result = await loop.run_in_executor(None, self.crew.kickoff)
+            result = await CrewExecutor.run_kickoff(self.crew)
             debug_log(
                 "H_CREW_KICKOFF",
                 "crew.py:_run_hierarchical_crew:after_kickoff",
@@ -495,14 +533,8 @@ B) SUCCESS (ONLY if zero errors AND positive evidence):
                 },
             )
 
-            if hasattr(result, "token_usage") and result.token_usage:
-                tu = result.token_usage
-                if isinstance(tu, dict):
-                    prompt = tu.get("prompt_tokens", 0)
-                    completion = tu.get("completion_tokens", 0)
-                else:
-                    prompt = getattr(tu, "prompt_tokens", 0)
-                    completion = getattr(tu, "completion_tokens", 0)
+            prompt, completion = extract_result_token_usage(result)
+            if prompt > 0 or completion > 0:
                 dashboard.update_token_usage(prompt, completion)
 
             result_str = str(result)
@@ -511,9 +543,10 @@ B) SUCCESS (ONLY if zero errors AND positive evidence):
             return TaskExecutionResult(
                 task=task, result=result_str, overall_success=True
             )
+        except KickoffBusyError as exc:
+            print_failure(str(exc))
+            return TaskExecutionResult(task=task, overall_success=False, error=str(exc))
         except Exception as exc:
-            import traceback
-
             tb_str = traceback.format_exc()
             print(f"\n[CREW ERROR] {type(exc).__name__}: {exc}")
             print(f"[TRACEBACK]\n{tb_str[:500]}")
@@ -545,11 +578,8 @@ B) SUCCESS (ONLY if zero errors AND positive evidence):
     ) -> TaskExecutionResult:
         """Execute a task using hierarchical crew delegation."""
         conversation_history = conversation_history or []
-        self.clear_agent_cache()
 
         try:
-            from .utils.threading.main_thread import set_main_event_loop
-
             try:
                 set_main_event_loop(asyncio.get_running_loop())
             except RuntimeError:
@@ -561,10 +591,9 @@ B) SUCCESS (ONLY if zero errors AND positive evidence):
 
             result = await self._run_hierarchical_crew(task, context_str)
 
-            if result and hasattr(result, "result"):
+            if result:
                 conversation_history.append({"user": task, "result": result})
-                if len(conversation_history) > 10:
-                    conversation_history[:] = conversation_history[-10:]
+                del conversation_history[:-10]
 
             dashboard.clear_action()
             return result
@@ -6,11 +6,33 @@ Works with OpenAI, Anthropic, and Google Gemini vision models.
 import base64
 import io
 import os
+from functools import lru_cache
 
 from PIL import Image
 from crewai.tools import BaseTool
 from pydantic import Field
 
+VERIFY_PROMPT_PREFIX = """Analyze this screenshot carefully.
+
+Instructions:
+1. Describe what you see on screen
+2. If there are numbers or text displays, quote them EXACTLY
+3. State whether the goal is achieved
+
+Format your response as:
+SCREEN STATE: [describe what you see]
+DISPLAY VALUE: [exact value shown, or "N/A" if no numeric display]
+GOAL STATUS: ACHIEVED or NOT ACHIEVED
+EVIDENCE: [why]
+
+GOAL TO VERIFY: """
+
+DESCRIBE_PROMPT = (
+    "Describe this image in detail. What do you see? "
+    "Include any text, UI elements, and notable features. "
+    "If there are numeric displays or text fields, quote their exact values."
+)
+
 
 def compress_image_for_analysis(
     image_path: str, max_size: int = 1024, quality: int = 70
@@ -18,6 +40,9 @@ def compress_image_for_analysis(
     """
     Compress image for LLM analysis to reduce token usage.
 
+    Downscaling uses thumbnail(), which shrinks by an integer factor with a
+    cheap box reduce before the final LANCZOS pass.
+
     Args:
         image_path: Path to the image file
         max_size: Maximum dimension (width or height) in pixels
@@ -27,16 +52,35 @@ def compress_image_for_analysis(
         Compressed image as bytes
     """
     img = Image.open(image_path)
-
-    if max(img.size) > max_size:
-        ratio = max_size / max(img.size)
-        new_size = (int(img.size[0] * ratio), int(img.size[1] * ratio))
-        img = img.resize(new_size, Image.Resampling.LANCZOS)
+    img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
 
     buffer = io.BytesIO()
     img.convert("RGB").save(buffer, format="JPEG", quality=quality)
-    buffer.seek(0)
-    return buffer.read()
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=4)
+def _gemini_client(api_key: str):
+    """Return a shared Gemini client for the given API key."""
+    from google import genai
+
+    return genai.Client(api_key=api_key)
+
+
+@lru_cache(maxsize=4)
+def _anthropic_client(api_key: str):
+    """Return a shared Anthropic client for the given API key."""
+    from anthropic import Anthropic
+
+    return Anthropic(api_key=api_key)
+
+
+@lru_cache(maxsize=4)
+def _openai_client(api_key: str):
+    """Return a shared OpenAI client for the given API key."""
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key)
 
 
 class AnalyzeImageTool(BaseTool):
@@ -81,18 +125,19 @@ class AnalyzeImageTool(BaseTool):
 
         try:
             compressed_bytes = compress_image_for_analysis(image_path)
-            image_data = base64.b64encode(compressed_bytes).decode("utf-8")
 
             provider = os.getenv("VISION_LLM_PROVIDER") or os.getenv(
                 "LLM_PROVIDER", "openai"
             )
 
             if provider == "google":
-                return self._analyze_with_gemini(image_data, image_path, goal)
-            elif provider == "anthropic":
-                return self._analyze_with_anthropic(image_data, image_path, goal)
+                return self._analyze_with_gemini(compressed_bytes, goal)
+
+            image_data = base64.b64encode(compressed_bytes).decode("ascii")
+            if provider == "anthropic":
+                return self._analyze_with_anthropic(image_data, goal)
             else:
-                return self._analyze_with_openai(image_data, image_path, goal)
+                return self._analyze_with_openai(image_data, goal)
 
         except Exception as e:
             return f"Error analyzing image: {str(e)}"
@@ -100,31 +145,11 @@ class AnalyzeImageTool(BaseTool):
     def _build_prompt(self, goal: str) -> str:
         """Build the analysis prompt based on whether a goal is provided."""
         if goal:
-            return f"""Analyze this screenshot carefully.
-
-GOAL TO VERIFY: {goal}
-
-Instructions:
-1. Describe what you see on screen
-2. If there are numbers or text displays, quote them EXACTLY
-3. State whether the goal is achieved
+            return VERIFY_PROMPT_PREFIX + goal
+        return DESCRIBE_PROMPT
 
-Format your response as:
-SCREEN STATE: [describe what you see]
-DISPLAY VALUE: [exact value shown, or "N/A" if no numeric display]
-GOAL STATUS: ACHIEVED or NOT ACHIEVED
-EVIDENCE: [why]
-"""
-        else:
-            return (
-                "Describe this image in detail. What do you see? "
-                "Include any text, UI elements, and notable features. "
-                "If there are numeric displays or text fields, quote their exact values."
-            )
-
-    def _analyze_with_gemini(self, image_data: str, image_path: str, goal: str) -> str:
+    def _analyze_with_gemini(self, image_bytes: bytes, goal: str) -> str:
         """Analyze image using Google Gemini."""
-        from google import genai
         from google.genai import types
 
         api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
@@ -137,10 +162,9 @@ EVIDENCE: [why]
         if model_name.startswith("gemini/"):
             model_name = model_name[7:]
 
-        image_bytes = compress_image_for_analysis(image_path)
         prompt = self._build_prompt(goal)
 
-        client = genai.Client(api_key=api_key)
+        client = _gemini_client(api_key)
         response = client.models.generate_content(
             model=model_name,
             contents=[
@@ -154,17 +178,13 @@ EVIDENCE: [why]
 
         return response.text
 
-    def _analyze_with_anthropic(
-        self, image_data: str, image_path: str, goal: str
-    ) -> str:
+    def _analyze_with_anthropic(self, image_data: str, goal: str) -> str:
         """Analyze image using Anthropic Claude."""
-        from anthropic import Anthropic
-
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             return "Error: ANTHROPIC_API_KEY not found"
 
-        client = Anthropic(api_key=api_key)
+        client = _anthropic_client(api_key)
         model_name = os.getenv("VISION_LLM_MODEL") or "claude-3-5-sonnet-20241022"
         prompt = self._build_prompt(goal)
 
@@ -194,15 +214,13 @@ EVIDENCE: [why]
 
         return response.content[0].text
 
-    def _analyze_with_openai(self, image_data: str, image_path: str, goal: str) -> str:
+    def _analyze_with_openai(self, image_data: str, goal: str) -> str:
         """Analyze image using OpenAI GPT-4 Vision."""
-        from openai import OpenAI
-
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             return "Error: OPENAI_API_KEY not found"
 
-        client = OpenAI(api_key=api_key)
+        client = _openai_client(api_key)
         model_name = os.getenv("VISION_LLM_MODEL") or "gpt-4o"
         prompt = self._build_prompt(goal)
 
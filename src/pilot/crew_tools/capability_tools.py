@@ -3,13 +3,18 @@ Capability-based app finder tool for CrewAI.
 Uses LLM intelligence to find best app for capability - NO hardcoding.
 """
 
-from pydantic import BaseModel, Field
-import asyncio
-import concurrent.futures
+import time
+from collections import OrderedDict
+from typing import Any, List, Tuple
+
+from pydantic import BaseModel, Field, PrivateAttr
 
 from .instrumented_tool import InstrumentedBaseTool
 from ..schemas.actions import ActionResult
 
+SELECTION_CACHE_SIZE = 64
+PROCESS_NAMES_TTL = 2.0
+
 
 class AppSelection(BaseModel):
     """LLM's app selection decision."""
@@ -45,6 +50,91 @@ class FindApplicationTool(InstrumentedBaseTool):
     LLM selects best available app on current platform."""
     args_schema: type[BaseModel] = FindAppInput
 
+    _llm: Any = PrivateAttr(default=None)
+    _structured_llm: Any = PrivateAttr(default=None)
+    _structured_llm_source: Any = PrivateAttr(default=None)
+    _selection_cache: OrderedDict = PrivateAttr(default_factory=OrderedDict)
+    _process_names: Tuple[float, List[str]] = PrivateAttr(default=(0.0, []))
+
+    def _get_structured_llm(self) -> Any:
+        """
+        Get the AppSelection-bound LLM, binding it only once per LLM instance.
+        Binding a new LLM also drops selections cached for the previous one.
+
+        Returns:
+            Runnable producing AppSelection objects
+        """
+        if self._structured_llm is None or self._structured_llm_source is not self._llm:
+            self._structured_llm = self._llm.with_structured_output(AppSelection)
+            self._structured_llm_source = self._llm
+            self._selection_cache.clear()
+        return self._structured_llm
+
+    def _get_process_names(self, process_tool: Any) -> List[str]:
+        """
+        Get running process names, sharing one scan across calls for a few seconds.
+
+        Args:
+            process_tool: Platform process tool
+
+        Returns:
+            Names of running processes
+        """
+        fetched_at, names = self._process_names
+        now = time.monotonic()
+        if not names or now - fetched_at > PROCESS_NAMES_TTL:
+            names = [p["name"] for p in process_tool.list_running_processes()]
+            self._process_names = (now, names)
+        return names
+
+    def _select_app(
+        self, platform: str, capability: str, app_names: List[str]
+    ) -> AppSelection:
+        """
+        Ask the LLM for the best app, reusing answers for identical inputs.
+        Answers are keyed by the bound LLM as well, and "NONE" or empty
+        selections are not cached so a later call can ask again.
+
+        Args:
+            platform: Current OS type
+            capability: Capability needed
+            app_names: Sorted, de-duplicated candidate app names
+
+        Returns:
+            AppSelection chosen by the LLM
+        """
+        structured_llm = self._get_structured_llm()
+        cache_key = (id(structured_llm), platform, capability, tuple(app_names))
+        cached = self._selection_cache.get(cache_key)
+        if cached is not None:
+            self._selection_cache.move_to_end(cache_key)
+            return cached
+
+        prompt = f"""Platform: {platform}
+Capability needed: {capability}
+
+Available applications:
+{chr(10).join(f"- {app}" for app in app_names)}
+
+Select the BEST USER-FACING application for "{capability}".
+
+IMPORTANT RULES:
+1. Select apps that have VISIBLE WINDOWS users can interact with
+2. AVOID background services, daemons, or system processes (they don't have UI)
+3. Look for the most obvious/common app name for the capability
+4. If capability mentions "settings" or "preferences", look for Settings/Preferences apps
+
+If no suitable USER-FACING app exists in the list, select "NONE".
+
+Select the EXACT app name from the list above."""
+
+        selection = structured_llm.invoke(prompt)
+        if selection.selected_app.strip() not in ("", "NONE"):
+            self._selection_cache[cache_key] = selection
+            if len(self._selection_cache) > SELECTION_CACHE_SIZE:
+                self._selection_cache.popitem(last=False)
+        return selection
+
     def _run(self, capability: str) -> ActionResult:
         """
         Find app using LLM intelligence:
@@ -77,8 +167,7 @@ class FindApplicationTool(InstrumentedBaseTool):
             if accessibility_tool and accessibility_tool.available:
                 app_names = accessibility_tool.get_running_app_names()
             else:
-                all_processes = process_tool.list_running_processes()
-                app_names = [p["name"] for p in all_processes]
+                app_names = self._get_process_names(process_tool)
 
             app_names = sorted(set(app_names))
         except Exception as e:
@@ -90,39 +179,8 @@ class FindApplicationTool(InstrumentedBaseTool):
                 error=str(e),
             )
 
-        # Ask LLM to select best app
-        structured_llm = llm.with_structured_output(AppSelection)
-
-        prompt = f"""Platform: {platform}
-Capability needed: {capability}
-
-Available applications:
-{chr(10).join(f"- {app}" for app in app_names)}
-
-Select the BEST USER-FACING application for "{capability}".
-
-IMPORTANT RULES:
-1. Select apps that have VISIBLE WINDOWS users can interact with
-2. AVOID background services, daemons, or system processes (they don't have UI)
-3. Look for the most obvious/common app name for the capability
-4. If capability mentions "settings" or "preferences", look for Settings/Preferences apps
-
-If no suitable USER-FACING app exists in the list, select "NONE".
-
-Select the EXACT app name from the list above."""
-
         try:
-            try:
-                running_loop = asyncio.get_running_loop()
-            except RuntimeError:
-                running_loop = None
-
-            if running_loop and running_loop.is_running():
-                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-                    future = pool.submit(asyncio.run, structured_llm.ainvoke(prompt))
-                    selection = future.result()
-            else:
-                selection = asyncio.run(structured_llm.ainvoke(prompt))
+            selection = self._select_app(platform, capability, app_names)
 
             if selection.selected_app == "NONE" or selection.confidence < 0.5:
                 return ActionResult(
@@ -4,7 +4,11 @@ Simple tools: screenshot, open_application, read_screen, scroll.
 """
 
 import atexit
+import hashlib
 import os
+import sys
+import time
+import uuid
 from pydantic import BaseModel, Field
 from typing import Any, Optional, Set
 
@@ -189,11 +193,13 @@ class OpenApplicationTool(InstrumentedBaseTool):
         Returns:
             True if app has windows, False if timeout reached
         """
-        import time
-
         accessibility = self._tool_registry.get_tool("accessibility")
         if not accessibility or not accessibility.available:
-            time.sleep(1.0)
+            screenshot_tool = self._tool_registry.get_tool("screenshot")
+            if screenshot_tool:
+                screenshot_tool.wait_until_stable(timeout=1.0)
+            else:
+                time.sleep(1.0)
             return True
 
         accessibility.invalidate_cache(app_name)
@@ -227,8 +233,6 @@ class OpenApplicationTool(InstrumentedBaseTool):
         Returns:
             True if app is confirmed frontmost, False otherwise
         """
-        import time
-
         from ..services.state import StateObserver
 
         observer = StateObserver(self._tool_registry)
@@ -1138,8 +1142,6 @@ class GetAccessibleElementsTool(InstrumentedBaseTool):
 
         try:
             dashboard.set_action("Scanning", f"{app_name} UI")
-            import time
-
             timing = get_timing_config()
             retry_count = max(1, timing.accessibility_retry_count)
             elements = []
@@ -1314,8 +1316,6 @@ class GetAccessibleElementsTool(InstrumentedBaseTool):
                     )
             elements_summary = _format_elements_smart_compact(selected, hidden_count)
 
-            import hashlib
-
             current_hash = hashlib.md5(elements_summary.encode()).hexdigest()[:8]
             ui_changed_msg = ""
 
@@ -1417,8 +1417,6 @@ class GetWindowImageTool(InstrumentedBaseTool):
         Returns:
             ActionResult with base64 image data
         """
-        import uuid
-
         screenshot_tool = self._tool_registry.get_tool("screenshot")
 
         if hasattr(screenshot_tool, "_cache"):
@@ -1443,7 +1441,7 @@ class GetWindowImageTool(InstrumentedBaseTool):
                 image = screenshot_tool.capture(use_cache=False)
 
             temp_path = f"/tmp/screenshot_{uuid.uuid4().hex[:8]}.png"
-            image.save(temp_path, format="PNG")
+            image.save(temp_path, format="PNG", compress_level=1)
 
             TempFileRegistry.register(temp_path)
 
@@ -1538,8 +1536,6 @@ class RequestHumanInputTool(InstrumentedBaseTool):
         )
 
         try:
-            import sys
-
             sys.stdout.flush()
             sys.stderr.flush()
 
@@ -3,11 +3,16 @@ Interactive GUI automation tools for CrewAI.
 Refactored for clarity: discovery separate from execution.
 """
 
+import math
+import time
+
+from PIL import Image
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Any, Optional
 
 from .instrumented_tool import InstrumentedBaseTool
 from ..schemas.actions import ActionResult
+from ..schemas.ocr_result import OCRResult
 from ..services.state import get_app_state
 from ..utils.ui import action_spinner, dashboard, print_action_result
 from ..utils.interaction.ocr_targeting import (
@@ -17,6 +22,45 @@ from ..utils.interaction.ocr_targeting import (
 from ..config.timing_config import get_timing_config
 
 
+HOTKEY_ALIASES = {"cmd": "command", "ctrl": "ctrl", "alt": "alt", "shift": "shift"}
+
+SPECIAL_KEYS = frozenset(
+    {
+        "tab",
+        "escape",
+        "backspace",
+        "delete",
+        "space",
+        "up",
+        "down",
+        "left",
+        "right",
+        "home",
+        "end",
+        "pageup",
+        "pagedown",
+        "f1",
+        "f2",
+        "f3",
+        "f4",
+        "f5",
+        "f6",
+        "f7",
+        "f8",
+        "f9",
+        "f10",
+        "f11",
+        "f12",
+        "return",
+        "enter",
+    }
+)
+
+PASTE_PREFIXES = ("/", "~", "http://", "https://")
+
+MIN_VIABLE_SCORE = 500.0
+
+
 def check_cancellation() -> Optional[ActionResult]:
     """
     Check if task cancellation has been requested.
@@ -223,12 +267,7 @@ class ClickElementTool(InstrumentedBaseTool):
 
             if x is not None and y is not None:
                 with action_spinner("Clicking", target):
-                    if click_type == "double":
-                        success = input_tool.double_click(x, y, validate=True)
-                    elif click_type == "right":
-                        success = input_tool.right_click(x, y, validate=True)
-                    else:
-                        success = input_tool.click(x, y, validate=True)
+                    success = self._click_at(input_tool, x, y, click_type)
 
                 print_action_result(success, f"Clicked {target}")
 
@@ -261,31 +300,18 @@ class ClickElementTool(InstrumentedBaseTool):
         screenshot_tool = self._tool_registry.get_tool("screenshot")
         ocr_tool = self._tool_registry.get_tool("ocr")
 
-        screenshot = screenshot_tool.capture()
         scaling = getattr(screenshot_tool, "scaling_factor", 1.0)
-        ocr_screenshot = screenshot
-        x_offset = 0
-        y_offset = 0
 
-        # Crop to app window if possible
+        # Capture only the app window if possible
+        window_bounds = None
         if current_app and accessibility_tool and accessibility_tool.available:
             window_bounds = accessibility_tool.get_app_window_bounds(current_app)
-            if window_bounds:
-                x, y, w, h = window_bounds
-                x_scaled = int(x * scaling)
-                y_scaled = int(y * scaling)
-                w_scaled = int(w * scaling)
-                h_scaled = int(h * scaling)
-                try:
-                    ocr_screenshot = screenshot.crop(
-                        (x_scaled, y_scaled, x_scaled + w_scaled, y_scaled + h_scaled)
-                    )
-                    x_offset = x
-                    y_offset = y
-                except Exception:
-                    pass
+        ocr_screenshot, x_offset, y_offset = self._capture_ocr_area(
+            screenshot_tool, window_bounds
+        )
 
         candidates = []
+        exact_matches = []
         try:
             exact_matches = ocr_tool.find_text(ocr_screenshot, target, fuzzy=False)
             if exact_matches:
@@ -297,13 +323,17 @@ class ClickElementTool(InstrumentedBaseTool):
         except Exception:
             pass
 
-        # Add all text for comprehensive scoring
-        try:
-            all_text = ocr_tool.extract_all_text(ocr_screenshot) or []
-            existing_ids = {id(item) for item in candidates}
-            candidates.extend(item for item in all_text if id(item) not in existing_ids)
-        except Exception:
-            pass
+        # Exact hits settle the click only when placement does not matter.
+        # With visual_context, all visible text competes on position.
+        if not exact_matches or visual_context:
+            try:
+                all_text = ocr_tool.extract_all_text(ocr_screenshot) or []
+                existing_ids = {id(item) for item in candidates}
+                candidates.extend(
+                    item for item in all_text if id(item) not in existing_ids
+                )
+            except Exception:
+                pass
 
         if not candidates:
             return ActionResult(
@@ -314,30 +344,10 @@ class ClickElementTool(InstrumentedBaseTool):
                 error=f"No OCR text found for '{target}'. Consider using get_window_image for visual analysis.",
             )
 
-        # Apply spatial filtering if visual_context provided
-        if visual_context:
-            candidates = filter_candidates_by_spatial_context(
-                candidates, visual_context, ocr_screenshot.width, ocr_screenshot.height
-            )
-
-        # Score all candidates
-        target_lower = target.lower().strip()
-        best_match = None
-        best_score = -999.0
-
-        for item in candidates:
-            score, relation = score_ocr_candidate(
-                item,
-                target_lower,
-                ocr_screenshot.width,
-                ocr_screenshot.height,
-                visual_context,
-            )
-            if score > best_score:
-                best_match = item
-                best_score = score
+        best_match, best_score = self._best_ocr_candidate(
+            candidates, target.lower().strip(), ocr_screenshot, visual_context
+        )
 
-        MIN_VIABLE_SCORE = 500.0
         if not best_match or best_score < MIN_VIABLE_SCORE:
             print_action_result(False, f"No OCR match for '{target}'")
             return ActionResult(
@@ -353,12 +363,7 @@ class ClickElementTool(InstrumentedBaseTool):
         y_screen = int(y_raw / scaling) + y_offset
 
         with action_spinner("Clicking", best_match.text):
-            if click_type == "double":
-                success = input_tool.double_click(x_screen, y_screen, validate=True)
-            elif click_type == "right":
-                success = input_tool.right_click(x_screen, y_screen, validate=True)
-            else:
-                success = input_tool.click(x_screen, y_screen, validate=True)
+            success = self._click_at(input_tool, x_screen, y_screen, click_type)
 
         print_action_result(success, "Clicked via OCR (SLOW)")
 
@@ -376,6 +381,99 @@ class ClickElementTool(InstrumentedBaseTool):
             },
         )
 
+    def _best_ocr_candidate(
+        self,
+        candidates: list[OCRResult],
+        target_lower: str,
+        ocr_screenshot: Image.Image,
+        visual_context: Optional[str],
+    ) -> tuple[Optional[OCRResult], float]:
+        """
+        Pick the highest-scoring OCR candidate for a click target.
+
+        When visual_context is given, candidates outside the described screen
+        region are dropped first (all are kept if none match the region), and
+        the remaining ones are scored with the spatial penalty applied.
+
+        Args:
+            candidates: OCR results to choose from
+            target_lower: Click target in lowercase
+            ocr_screenshot: Image the candidates were read from, for sizing
+            visual_context: Spatial hint such as "bottom right", or None
+
+        Returns:
+            Tuple of (best match or None, its score). The score is -999.0
+            when there are no candidates.
+        """
+        if visual_context:
+            candidates = filter_candidates_by_spatial_context(
+                candidates, visual_context, ocr_screenshot.width, ocr_screenshot.height
+            )
+
+        best_match = None
+        best_score = -999.0
+        for item in candidates:
+            score, _ = score_ocr_candidate(
+                item,
+                target_lower,
+                ocr_screenshot.width,
+                ocr_screenshot.height,
+                visual_context,
+            )
+            if score > best_score:
+                best_match = item
+                best_score = score
+        return best_match, best_score
+
+    def _capture_ocr_area(
+        self,
+        screenshot_tool: Any,
+        window_bounds: Optional[tuple[int, int, int, int]],
+    ) -> tuple[Image.Image, int, int]:
+        """
+        Capture the screen area that OCR should read.
+
+        With window bounds, only that region is captured so OCR skips the rest
+        of the screen. If there are no bounds or the region capture fails, the
+        full screen is captured instead.
+
+        Args:
+            screenshot_tool: Registry screenshot tool used for the capture
+            window_bounds: Target window as (x, y, width, height), or None
+
+        Returns:
+            Tuple of (image, offset_x, offset_y). The offsets are the screen
+            position of the image's top-left corner, to be added to OCR
+            coordinates before clicking; both are 0 for a full capture.
+        """
+        if window_bounds:
+            x, y, w, h = window_bounds
+            try:
+                region = (int(x), int(y), int(w), int(h))
+                return screenshot_tool.capture(region=region), int(x), int(y)
+            except Exception:
+                pass
+        return screenshot_tool.capture(), 0, 0
+
+    def _click_at(self, input_tool: Any, x: int, y: int, click_type: str) -> bool:
+        """
+        Click at screen coordinates with the requested click type.
+
+        Args:
+            input_tool: Registry input tool that performs the click
+            x: Screen X coordinate
+            y: Screen Y coordinate
+            click_type: "single", "double" or "right"; anything else clicks once
+
+        Returns:
+            True if the click was performed and validated
+        """
+        if click_type == "double":
+            return input_tool.double_click(x, y, validate=True)
+        if click_type == "right":
+            return input_tool.right_click(x, y, validate=True)
+        return input_tool.click(x, y, validate=True)
+
     def _resolve_accessible_element(
         self, accessibility_tool, current_app: Optional[str], target: str
     ) -> Optional[dict]:
@@ -448,30 +546,14 @@ class ClickElementTool(InstrumentedBaseTool):
         if not screenshot_tool or not ocr_tool:
             return None
 
-        screenshot = screenshot_tool.capture()
         scaling = getattr(screenshot_tool, "scaling_factor", 1.0)
-        ocr_screenshot = screenshot
-        x_offset = 0
-        y_offset = 0
 
         window_bounds = None
         if hasattr(accessibility_tool, "get_app_window_bounds"):
             window_bounds = accessibility_tool.get_app_window_bounds(current_app)
-
-        if window_bounds:
-            x, y, w, h = window_bounds
-            x_scaled = int(x * scaling)
-            y_scaled = int(y * scaling)
-            w_scaled = int(w * scaling)
-            h_scaled = int(h * scaling)
-            try:
-                ocr_screenshot = screenshot.crop(
-                    (x_scaled, y_scaled, x_scaled + w_scaled, y_scaled + h_scaled)
-                )
-                x_offset = x
-                y_offset = y
-            except Exception:
-                pass
+        ocr_screenshot, x_offset, y_offset = self._capture_ocr_area(
+            screenshot_tool, window_bounds
+        )
 
         target_raw = (target or "").strip()
         if not target_raw:
@@ -530,7 +612,7 @@ class ClickElementTool(InstrumentedBaseTool):
                     best_score = score
                     best_match = item
 
-        if not best_match or best_score < 500.0:
+        if not best_match or best_score < MIN_VIABLE_SCORE:
             return None
 
         x_raw, y_raw = best_match.center
@@ -580,8 +662,6 @@ class ClickElementTool(InstrumentedBaseTool):
         target_lower: str,
         window_bounds: Optional[tuple[int, int, int, int]],
     ) -> Optional[dict]:
-        import math
-
         px, py = point
         best = None
         best_score = -1.0
@@ -773,13 +853,7 @@ class TypeTextTool(InstrumentedBaseTool):
                     hotkey_sequences = []
                     break
 
-                key_map = {
-                    "cmd": "command",
-                    "ctrl": "ctrl",
-                    "alt": "alt",
-                    "shift": "shift",
-                }
-                hotkey_sequences.append([key_map.get(k, k) for k in parts])
+                hotkey_sequences.append([HOTKEY_ALIASES.get(k, k) for k in parts])
 
         is_hotkey = len(hotkey_sequences) > 0
 
@@ -816,8 +890,6 @@ class TypeTextTool(InstrumentedBaseTool):
 
         try:
             if is_hotkey:
-                import time
-
                 timing = get_timing_config()
                 for keys in hotkey_sequences:
                     input_tool.hotkey(*keys)
@@ -838,37 +910,8 @@ class TypeTextTool(InstrumentedBaseTool):
                     confidence=1.0,
                 )
 
-            special_keys = {
-                "tab",
-                "escape",
-                "backspace",
-                "delete",
-                "space",
-                "up",
-                "down",
-                "left",
-                "right",
-                "home",
-                "end",
-                "pageup",
-                "pagedown",
-                "f1",
-                "f2",
-                "f3",
-                "f4",
-                "f5",
-                "f6",
-                "f7",
-                "f8",
-                "f9",
-                "f10",
-                "f11",
-                "f12",
-                "return",
-                "enter",
-            }
-            if text.lower().strip() in special_keys:
-                key_name = text.lower().strip()
+            key_name = text.lower().strip()
+            if key_name in SPECIAL_KEYS:
                 if key_name == "enter":
                     key_name = "return"
                 input_tool.press_key(key_name)
@@ -881,12 +924,9 @@ class TypeTextTool(InstrumentedBaseTool):
 
             should_paste = (
                 len(text) > 50
-                or text.startswith("/")
-                or text.startswith("~")
+                or text.startswith(PASTE_PREFIXES)
                 or "\\" in text
                 or ("/" in text and len(text) > 20)
-                or text.startswith("http://")
-                or text.startswith("https://")
             )
 
             if use_clipboard or should_paste:
@@ -149,6 +149,9 @@ async def main(
             browser_profile_directory=browser_profile,
         )
 
+        loader.set_message("Preparing agents...")
+        crew.prepare_agents()
+
     tool_count = len(crew.tool_registry.list_available_tools())
     webhook_port = webhook_server.port if webhook_server else None
     browser_display = browser_profile if use_browser_profile else "Default"
@@ -248,6 +251,7 @@ async def main(
     finally:
         listener.stop()
         dashboard.stop_dashboard()
+        await crew.close()
 
 
 def cli():
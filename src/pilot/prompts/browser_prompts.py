@@ -3,6 +3,8 @@ Browser-Use Agent prompt templates and guidelines.
 Comprehensive prompts for autonomous web automation.
 """
 
+from functools import lru_cache
+
 SECTION_DIVIDER = "-" * 60
 
 
@@ -413,6 +415,7 @@ CORE PRINCIPLES:
 """
 
 
+@lru_cache(maxsize=None)
 def build_full_context(
     has_twilio: bool = False,
     has_image_gen: bool = False,
@@ -421,6 +424,9 @@ def build_full_context(
     """
     Build complete Browser-Use Agent context with all guidance.
 
+    The result depends only on the capability flags, so each combination is
+    assembled once per process and reused for every subsequent browser task.
+
     Args:
         has_twilio: Whether Twilio tools are available
         has_image_gen: Whether image generation tools are available
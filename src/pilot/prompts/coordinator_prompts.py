@@ -113,10 +113,10 @@ def build_coordinator_prompt(task: str, conversation_history: list = None) -> st
     Returns:
         Complete prompt string
     """
-    history_context = ""
+    history_parts = []
 
     if conversation_history:
-        history_context = "\n\nConversation History (for context):\n"
+        history_parts.append("\n\nConversation History (for context):\n")
         for i, entry in enumerate(conversation_history[-5:], 1):
             user_msg = entry.get("user", "")
             result = entry.get("result", {})
@@ -125,9 +125,11 @@ def build_coordinator_prompt(task: str, conversation_history: list = None) -> st
                 analysis.get("direct_response") if isinstance(analysis, dict) else None
             )
 
-            history_context += f"{i}. User: {user_msg}\n"
+            history_parts.append(f"{i}. User: {user_msg}\n")
             if direct_resp:
-                history_context += f"   Assistant: {direct_resp}\n"
+                history_parts.append(f"   Assistant: {direct_resp}\n")
+
+    history_context = "".join(history_parts)
 
     return f"""{COORDINATOR_SYSTEM_PROMPT}
 {history_context}
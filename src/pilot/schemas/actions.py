@@ -3,7 +3,7 @@ Action schemas for different agent types.
 """
 
 from typing import Optional, List, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from .gui_elements import UIElement, SemanticTarget
 
 
@@ -12,6 +12,8 @@ class GUIAction(BaseModel):
     Structured action for GUI automation.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     action: Literal[
         "click", "double_click", "right_click", "type", "scroll", "drag", "hotkey"
     ] = Field(description="Type of action to perform")
@@ -38,6 +40,8 @@ class ActionResult(BaseModel):
     Result of an action execution with support for agent handoffs.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     success: bool = Field(description="Whether the action succeeded")
     action_taken: str = Field(
         description="Description of the action that was performed"
@@ -3,7 +3,7 @@ Typed schemas for browser agent output.
 """
 
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 
 class FileDetail(BaseModel):
@@ -11,6 +11,8 @@ class FileDetail(BaseModel):
     Details about a downloaded or created file.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     path: str = Field(description="Absolute path to the file")
     name: str = Field(description="File name with extension")
     size: int = Field(description="File size in bytes")
@@ -21,10 +23,9 @@ class BrowserOutput(BaseModel):
     Structured output from browser agent with file tracking.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     text: str = Field(description="Summary of what the browser accomplished")
-    files: List[str] = Field(
-        default_factory=list, description="List of absolute file paths"
-    )
     file_details: List[FileDetail] = Field(
         default_factory=list, description="Detailed information about each file"
     )
@@ -32,13 +33,19 @@ class BrowserOutput(BaseModel):
         default=None, description="Working directory where files were saved"
     )
 
+    @computed_field
+    @property
+    def files(self) -> List[str]:
+        """List of absolute file paths, derived from file_details."""
+        return [detail.path for detail in self.file_details]
+
     def has_files(self) -> bool:
         """Check if any files were downloaded/created."""
-        return len(self.files) > 0
+        return len(self.file_details) > 0
 
     def get_file_count(self) -> int:
         """Get the number of files."""
-        return len(self.files)
+        return len(self.file_details)
 
     def get_total_size_kb(self) -> float:
         """Get total size of all files in KB."""
@@ -48,11 +55,11 @@ class BrowserOutput(BaseModel):
         """
         Format a human-readable summary of the browser output.
         """
-        summary = f"📝 {self.text}\n"
+        parts = [f"📝 {self.text}\n"]
         if self.has_files():
-            summary += f"\n📁 Downloaded {self.get_file_count()} file(s):\n"
+            parts.append(f"\n📁 Downloaded {self.get_file_count()} file(s):\n")
             for detail in self.file_details:
                 size_kb = detail.size / 1024
-                summary += f"   • {detail.name} ({size_kb:.1f} KB)\n"
-                summary += f"     Path: {detail.path}\n"
-        return summary
+                parts.append(f"   • {detail.name} ({size_kb:.1f} KB)\n")
+                parts.append(f"     Path: {detail.path}\n")
+        return "".join(parts)
@@ -3,7 +3,7 @@ Type-safe schemas for OCR results.
 """
 
 from typing import Tuple, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class OCRResult(BaseModel):
@@ -11,6 +11,8 @@ class OCRResult(BaseModel):
     Structured OCR recognition result with bounding box and confidence.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     text: str = Field(description="Recognized text content")
     bounds: Tuple[int, int, int, int] = Field(
         description="Bounding box as (x, y, width, height)"
@@ -8,17 +8,26 @@ Submodules:
 - external: External service integrations (Twilio, webhooks)
 """
 
-from .crew import (
-    CrewAgentFactory,
-    CrewExecutor,
-    CrewGuiDelegate,
-    CrewToolsFactory,
-    LLMEventService,
-    StepCallbackFactory,
-)
-from .external import TwilioService, WebhookServer
+import importlib
+
 from .state import AppStateManager, get_app_state
 
+_LAZY_EXPORTS = {
+    "CrewAgentFactory": ".crew",
+    "CrewExecutor": ".crew",
+    "CrewGuiDelegate": ".crew",
+    "CrewToolsFactory": ".crew",
+    "LLMEventService": ".crew",
+    "StepCallbackFactory": ".crew",
+    "TwilioService": ".external",
+    "WebhookServer": ".external",
+    "AudioCapture": ".voice",
+    "VoiceInputService": ".voice",
+    "StateObserver": ".state",
+    "SystemState": ".state",
+    "ObservationScope": ".state",
+}
+
 __all__ = [
     "CrewAgentFactory",
     "CrewExecutor",
@@ -40,26 +49,13 @@ __all__ = [
 
 def __getattr__(name):
     """
-    Lazy import for optional services to avoid dependency issues.
-    """
-    if name == "AudioCapture":
-        from .voice import AudioCapture
-
-        return AudioCapture
-    elif name == "VoiceInputService":
-        from .voice import VoiceInputService
+    Lazy import for crew, external and voice services.
 
-        return VoiceInputService
-    elif name == "StateObserver":
-        from .state import StateObserver
-
-        return StateObserver
-    elif name == "SystemState":
-        from .state import SystemState
-
-        return SystemState
-    elif name == "ObservationScope":
-        from .state import ObservationScope
-
-        return ObservationScope
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    Importing a light submodule such as ``services.state`` runs this package
+    first, so eager imports here would pull CrewAI, Twilio and Flask into
+    every tool that only needs app state.
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
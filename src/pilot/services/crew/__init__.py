@@ -3,7 +3,7 @@ Crew-related services for agent creation, execution, and event handling.
 """
 
 from .crew_agents import CrewAgentFactory
-from .crew_executor import CrewExecutor
+from .crew_executor import CrewExecutor, KickoffBusyError
 from .crew_gui_delegate import CrewGuiDelegate
 from .crew_tools_factory import CrewToolsFactory
 from .llm_events import LLMEventService
@@ -14,6 +14,7 @@ __all__ = [
     "CrewExecutor",
     "CrewGuiDelegate",
     "CrewToolsFactory",
+    "KickoffBusyError",
     "LLMEventService",
     "StepCallbackFactory",
 ]
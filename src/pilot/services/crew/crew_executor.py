@@ -5,8 +5,11 @@ Handles crew creation and execution logic.
 """
 
 import asyncio
+import threading
 import time
-from typing import Dict
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, ClassVar, Dict, Optional, Set
 
 from crewai import Agent, Crew, Process, Task
 
@@ -14,12 +17,74 @@ from ...schemas import TaskExecutionResult
 from ...utils.logging import debug_log, extract_result_token_usage
 from ...utils.ui import dashboard, print_failure, print_success
 
+MAX_KICKOFF_WORKERS = 4
+
+
+class KickoffBusyError(RuntimeError):
+    """Raised when every kickoff worker is still held by an earlier task."""
+
 
 class CrewExecutor:
     """
     Utility class for executing CrewAI hierarchical crews.
     """
 
+    _kickoff_pool: ClassVar[Optional[ThreadPoolExecutor]] = None
+    _active_kickoffs: ClassVar[Set[Future]] = set()
+    _kickoff_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def run_kickoff(cls, crew: Crew) -> "asyncio.Future[Any]":
+        """
+        Run crew.kickoff on the shared kickoff thread pool.
+
+        A kickoff cancelled with ESC keeps its worker until CrewAI returns,
+        so a new kickoff is refused rather than queued behind stale ones
+        once every worker is taken.
+
+        Args:
+            crew: CrewAI Crew instance
+
+        Returns:
+            Awaitable future resolving to the kickoff result
+
+        Raises:
+            KickoffBusyError: If all workers are still busy with earlier kickoffs
+        """
+        with cls._kickoff_lock:
+            if len(cls._active_kickoffs) >= MAX_KICKOFF_WORKERS:
+                raise KickoffBusyError(
+                    "Previous task is still stopping. Try again in a moment."
+                )
+            if cls._kickoff_pool is None:
+                cls._kickoff_pool = ThreadPoolExecutor(
+                    max_workers=MAX_KICKOFF_WORKERS, thread_name_prefix="crew"
+                )
+            future = cls._kickoff_pool.submit(crew.kickoff)
+            cls._active_kickoffs.add(future)
+        future.add_done_callback(cls._forget_kickoff)
+        return asyncio.wrap_future(future)
+
+    @classmethod
+    def has_active_kickoffs(cls) -> bool:
+        """Return True while any earlier kickoff is still running."""
+        with cls._kickoff_lock:
+            return bool(cls._active_kickoffs)
+
+    @classmethod
+    def _forget_kickoff(cls, future: Future) -> None:
+        """Drop a finished kickoff from the active set."""
+        with cls._kickoff_lock:
+            cls._active_kickoffs.discard(future)
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Release the kickoff thread pool without waiting for running kickoffs."""
+        with cls._kickoff_lock:
+            pool, cls._kickoff_pool = cls._kickoff_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
     @staticmethod
     def create_crew(
         agents_dict: Dict[str, Agent],
@@ -67,7 +132,7 @@ class CrewExecutor:
         Returns:
             TaskExecutionResult with execution outcome
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
             t0 = time.time()
             debug_log(
@@ -76,7 +141,7 @@ class CrewExecutor:
                 "Calling CrewAI kickoff in executor",
                 {"executor_loop_running": bool(loop.is_running())},
             )
-            result = await loop.run_in_executor(None, crew.kickoff)
+            result = await CrewExecutor.run_kickoff(crew)
             debug_log(
                 "H_CREW_KICKOFF",
                 "crew_executor.py:execute_crew:after_kickoff",
@@ -96,9 +161,10 @@ class CrewExecutor:
             return TaskExecutionResult(
                 task=task, result=result_str, overall_success=True
             )
+        except KickoffBusyError as exc:
+            print_failure(str(exc))
+            return TaskExecutionResult(task=task, overall_success=False, error=str(exc))
         except Exception as exc:
-            import traceback
-
             tb_str = traceback.format_exc()
             print(f"\n[CREW ERROR] {type(exc).__name__}: {exc}")
             print(f"[TRACEBACK]\n{tb_str[:500]}")
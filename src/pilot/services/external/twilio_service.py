@@ -75,6 +75,7 @@ class TwilioService:
         self.messages: list[SMSMessage] = []
         self.messages_lock = threading.Lock()
         self.llm_client = None
+        self._structured_llm = None
 
         self.message_expiry_seconds = 300
 
@@ -88,6 +89,20 @@ class TwilioService:
             llm_client: LLM client instance (Langchain compatible)
         """
         self.llm_client = llm_client
+        self._structured_llm = None
+
+    def _get_structured_llm(self) -> Any:
+        """
+        Get the VerificationCode-bound LLM, binding it on first use.
+
+        Returns:
+            Runnable producing VerificationCode objects
+        """
+        if self._structured_llm is None:
+            self._structured_llm = self.llm_client.with_structured_output(
+                VerificationCode
+            )
+        return self._structured_llm
 
     def is_configured(self) -> bool:
         """
@@ -193,7 +208,7 @@ If you cannot find a verification code, return "NONE".
 """
 
             dashboard.add_log_entry(ActionType.ANALYZE, "Extracting code using LLM")
-            structured_llm = self.llm_client.with_structured_output(VerificationCode)
+            structured_llm = self._get_structured_llm()
             result: VerificationCode = await structured_llm.ainvoke(prompt)
 
             if result and result.code and result.code != "NONE":
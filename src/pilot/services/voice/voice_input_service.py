@@ -100,7 +100,7 @@ class VoiceInputService:
 
             self.is_listening = True
 
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             loop.run_in_executor(None, self.connection.start_listening)
 
             logger.info("⏳ Waiting for connection to establish...")
@@ -4,6 +4,7 @@ Provides AI image generation using Google Gemini for ads, marketing, and content
 Uses task-specific folders to isolate images per browser task.
 """
 
+import asyncio
 import os
 import re
 import tempfile
@@ -233,7 +234,7 @@ def _create_image_tools(api_key: str) -> Tools:
     @tools.action(
         description="Generate an image using AI for ads, marketing, banners, or content creation. Each image gets a unique filename in the current task's folder."
     )
-    def generate_image(prompt: str) -> ActionResult:
+    async def generate_image(prompt: str) -> ActionResult:
         """
         Generate an image from a text description using Google Gemini.
         Each image is saved in the current task's dedicated folder.
@@ -254,7 +255,8 @@ def _create_image_tools(api_key: str) -> Tools:
 
             client = genai.Client(api_key=api_key)
 
-            response = client.models.generate_content(
+            response = await asyncio.to_thread(
+                client.models.generate_content,
                 model="gemini-2.5-flash-image",
                 contents=[prompt],
             )
@@ -266,7 +268,7 @@ def _create_image_tools(api_key: str) -> Tools:
             for part in response.parts:
                 if part.inline_data is not None:
                     image = part.as_image()
-                    image.save(str(output_path))
+                    await asyncio.to_thread(image.save, str(output_path))
 
                     task_id = ImageTaskManager.get_current_task_id() or "unknown"
                     dashboard.add_log_entry(
@@ -3,6 +3,7 @@ Cross-platform screenshot capture tool.
 """
 
 import base64
+import hashlib
 import io
 import time
 from typing import Optional, Tuple, Dict, Any
@@ -19,6 +20,7 @@ class ScreenshotTool:
     """
 
     CACHE_TTL = 0.0
+    FINGERPRINT_STRIDE = 8
 
     def __init__(self):
         """Initialize and detect display scaling."""
@@ -131,13 +133,15 @@ class ScreenshotTool:
             provider = CG.CGImageGetDataProvider(cgimage)
             data = CG.CGDataProviderCopyData(provider)
 
-            import numpy as np
-
-            byte_data = bytes(data)
-            img_array = np.frombuffer(byte_data, dtype=np.uint8)
-            img_array = img_array.reshape((height_px, bytes_per_row // 4, 4))
-            img_array = img_array[:, :width_px, [2, 1, 0, 3]]
-            screenshot = Image.fromarray(img_array, "RGBA")
+            screenshot = Image.frombuffer(
+                "RGBA",
+                (width_px, height_px),
+                data,
+                "raw",
+                "BGRA",
+                bytes_per_row,
+                1,
+            )
 
         self.active_window_bounds = {
             "x": x,
@@ -225,6 +229,51 @@ class ScreenshotTool:
         self._cache = (now, region, screenshot)
         return screenshot
 
+    def wait_until_stable(
+        self, timeout: float = 1.0, poll_interval: float = 0.1
+    ) -> bool:
+        """
+        Wait for the screen to change and then stop changing.
+
+        Polls full-screen captures and returns as soon as two consecutive
+        frames match after at least one change was seen. If the screen never
+        changes, this waits the full timeout like a fixed delay would.
+
+        Args:
+            timeout: Maximum seconds to wait
+            poll_interval: Seconds between captures
+
+        Returns:
+            True if the screen settled after a change, False on timeout
+        """
+        deadline = time.time() + timeout
+        previous = self._frame_fingerprint(self.capture(use_cache=False))
+        changed = False
+
+        while time.time() < deadline:
+            time.sleep(poll_interval)
+            current = self._frame_fingerprint(self.capture(use_cache=False))
+            if current == previous and changed:
+                return True
+            changed = changed or current != previous
+            previous = current
+
+        return False
+
+    def _frame_fingerprint(self, image: Image.Image) -> bytes:
+        """
+        Compute a short digest of a captured frame for change detection.
+
+        Hashes a nearest-neighbour sample of every FINGERPRINT_STRIDE-th pixel
+        per axis, so the full pixel buffer is never copied out of PIL.
+        """
+        stride = self.FINGERPRINT_STRIDE
+        sample = image.resize(
+            (max(image.width // stride, 1), max(image.height // stride, 1)),
+            Image.Resampling.NEAREST,
+        )
+        return hashlib.blake2b(sample.tobytes(), digest_size=8).digest()
+
     def invalidate_cache(self) -> None:
         """Clear the screenshot cache."""
         self._cache = None
@@ -246,10 +295,7 @@ class ScreenshotTool:
 
         buffer = io.BytesIO()
         screenshot.save(buffer, format=format)
-        buffer.seek(0)
-
-        encoded = base64.b64encode(buffer.read()).decode("utf-8")
-        return encoded
+        return base64.b64encode(buffer.getbuffer()).decode("ascii")
 
     def save(
         self, filepath: str, region: Optional[Tuple[int, int, int, int]] = None
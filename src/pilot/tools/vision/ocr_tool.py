@@ -27,6 +27,10 @@ class OCRTool:
     Text detection with precise bounding box coordinates.
     Uses platform-optimized OCR engines with automatic fallback.
     Includes LRU caching based on image hash for repeated OCR calls.
+    Recognition of the most recent full frame is also kept, so find_text and
+    extract_all_text on the same screenshot object share one OCR pass. The
+    tool holds a strong reference to that frame until the next full-frame
+    lookup replaces it or clear_cache() releases it.
     """
 
     CACHE_SIZE = 32
@@ -43,6 +47,8 @@ class OCRTool:
         self._initialize_engine(use_gpu)
         self._ocr_cache: dict = {}
         self._cache_order: list = []
+        self._frame: Optional[Image.Image] = None
+        self._frame_results: dict = {}
 
     def _initialize_engine(self, use_gpu: Optional[bool]) -> None:
         """
@@ -64,6 +70,8 @@ class OCRTool:
         """
         Find text in screenshot and return exact bounding boxes.
         Automatically tries fallback engines if primary fails.
+        Repeated full-image lookups on the same screenshot object reuse
+        its recognition results instead of running OCR again.
 
         Args:
             screenshot: PIL Image to search
@@ -77,15 +85,16 @@ class OCRTool:
         if not self.fallback_engines:
             return []
 
-        for engine in self.fallback_engines:
+        target_lower = target_text.lower()
+
+        for index, engine in enumerate(self.fallback_engines):
             try:
-                results = engine.recognize_text(screenshot, region=region)
+                results = self._recognize(index, engine, screenshot, region)
 
-                if not results or len(results) == 0:
+                if not results:
                     continue
 
                 matches = []
-                target_lower = target_text.lower()
 
                 for result in results:
                     text = result.text
@@ -121,6 +130,42 @@ class OCRTool:
 
         return []
 
+    def _recognize(
+        self,
+        index: int,
+        engine: OCREngine,
+        screenshot: Image.Image,
+        region: Optional[Tuple[int, int, int, int]],
+    ) -> List[OCRResult]:
+        """
+        Run one engine on a screenshot, reusing results for the current frame.
+
+        The frame is matched by identity and held in self._frame, so its id
+        cannot be reused while results are kept. The reference lives until a
+        new screenshot object replaces it or clear_cache() drops it.
+
+        Args:
+            index: Position of the engine in fallback_engines
+            engine: OCR engine to run
+            screenshot: PIL Image to analyze
+            region: Optional region to analyze; region lookups are not reused
+
+        Returns:
+            Raw recognition results from the engine
+        """
+        if region is not None:
+            return engine.recognize_text(screenshot, region=region) or []
+
+        if screenshot is not self._frame:
+            self._frame = screenshot
+            self._frame_results = {}
+
+        results = self._frame_results.get(index)
+        if results is None:
+            results = engine.recognize_text(screenshot, region=None) or []
+            self._frame_results[index] = results
+        return results
+
     def _cache_get(self, key: str) -> Optional[List[OCRResult]]:
         """Retrieve from LRU cache."""
         return self._ocr_cache.get(key)
@@ -143,10 +188,10 @@ class OCRTool:
         if not self.fallback_engines:
             return []
 
-        for engine in self.fallback_engines:
+        for index, engine in enumerate(self.fallback_engines):
             try:
-                results = engine.recognize_text(screenshot, region=region)
-                if results and len(results) > 0:
+                results = self._recognize(index, engine, screenshot, region)
+                if results:
                     return results
             except Exception:
                 continue
@@ -185,3 +230,5 @@ class OCRTool:
         """Clear the OCR result cache."""
         self._ocr_cache.clear()
         self._cache_order.clear()
+        self._frame = None
+        self._frame_results = {}
@@ -3,7 +3,9 @@ OCR-based targeting utilities for GUI automation.
 Word-boundary matching, spatial scoring, and candidate ranking.
 """
 
+import math
 import re
+from functools import lru_cache
 from typing import Optional, List, Any
 
 
@@ -18,8 +20,13 @@ def is_word_boundary_match(text: str, target: str) -> bool:
     Returns:
         True if target is a whole word in text
     """
-    pattern = r"\b" + re.escape(target) + r"\b"
-    return bool(re.search(pattern, text, re.IGNORECASE))
+    return _word_boundary_pattern(target).search(text) is not None
+
+
+@lru_cache(maxsize=128)
+def _word_boundary_pattern(target: str) -> re.Pattern:
+    """Compile the whole-word pattern for a target once and reuse it."""
+    return re.compile(r"\b" + re.escape(target) + r"\b", re.IGNORECASE)
 
 
 def determine_text_relation(text_lower: str, target_lower: str) -> str:
@@ -124,13 +131,12 @@ def score_ocr_candidate(
     if relation == "none":
         return (-999.0, "none")
 
-    # Filter out bad substring matches
-    length_delta = abs(len(text_lower) - len(target_lower))
+    # Substring relations are, by construction, not whole-word matches,
+    # so they are always rejected without re-running the regex.
     if relation == "substring":
-        if length_delta > 2 or not is_word_boundary_match(text_lower, target_lower):
-            return (-999.0, "none")
-        if length_delta > 10:
-            return (-999.0, "none")
+        return (-999.0, "none")
+
+    length_delta = abs(len(text_lower) - len(target_lower))
 
     # Base scores by relation type
     base_score = {
@@ -185,33 +191,29 @@ def filter_candidates_by_spatial_context(
         return candidates
 
     context_lower = visual_context.lower()
-    filtered = candidates.copy()
+    y_min, y_max = -math.inf, math.inf
+    x_min, x_max = -math.inf, math.inf
 
-    # Vertical filtering
+    # Vertical bounds
     if "top" in context_lower or "above" in context_lower:
-        filtered = [
-            item for item in filtered if item.center[1] < screenshot_height * 0.4
-        ]
+        y_max = screenshot_height * 0.4
     elif "bottom" in context_lower or "below" in context_lower:
-        filtered = [
-            item for item in filtered if item.center[1] > screenshot_height * 0.6
-        ]
+        y_min = screenshot_height * 0.6
     elif "middle" in context_lower or "center" in context_lower:
-        filtered = [
-            item
-            for item in filtered
-            if screenshot_height * 0.3 < item.center[1] < screenshot_height * 0.7
-        ]
+        y_min, y_max = screenshot_height * 0.3, screenshot_height * 0.7
 
-    # Horizontal filtering
+    # Horizontal bounds
     if "left" in context_lower:
-        filtered = [
-            item for item in filtered if item.center[0] < screenshot_width * 0.4
-        ]
+        x_max = screenshot_width * 0.4
     elif "right" in context_lower:
-        filtered = [
-            item for item in filtered if item.center[0] > screenshot_width * 0.6
-        ]
+        x_min = screenshot_width * 0.6
+
+    # Single pass over candidates with both bounds applied
+    filtered = [
+        item
+        for item in candidates
+        if y_min < item.center[1] < y_max and x_min < item.center[0] < x_max
+    ]
 
     # Order filtering
     if "first" in context_lower:
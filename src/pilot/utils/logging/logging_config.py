@@ -172,6 +172,7 @@ def silence_browser_logs() -> None:
 
 
 _DEBUG_LOG_PATH = Path(__file__).parent.parent.parent / ".cursor" / "debug.log"
+_DEBUG_LOG_ENABLED = _DEBUG_LOG_PATH.parent.is_dir()
 _DEBUG_SESSION_ID = "debug-session"
 _DEBUG_RUN_ID = "run1"
 _DEBUG_LLM_EVENT_LIMIT = 30
@@ -190,7 +191,8 @@ def debug_log(
         message: Log message
         data: Additional data dictionary to include
     """
-    global _debug_llm_events_logged
+    if not _DEBUG_LOG_ENABLED:
+        return
     payload = {
         "sessionId": _DEBUG_SESSION_ID,
         "runId": _DEBUG_RUN_ID,
@@ -6,10 +6,24 @@ import getpass
 import os
 import platform
 import subprocess
+from functools import lru_cache
 from typing import List, Dict, Optional
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
+def _static_platform_context() -> str:
+    """Build the platform, user and home lines, which never change per process."""
+    os_name = platform.system()
+    platform_names = {"Darwin": "macOS", "Windows": "Windows", "Linux": "Linux"}
+    platform_name = platform_names.get(os_name, os_name)
+    return (
+        f"Platform: {platform_name} {platform.release()} ({platform.machine()})\n"
+        f"Username: {getpass.getuser()}\n"
+        f"Home Directory: {os.path.expanduser('~')}\n"
+    )
+
+
 class PlatformHelper:
     """
     Helper utilities for platform-specific operations.
@@ -164,18 +178,9 @@ class PlatformHelper:
         Returns:
             Multi-line string with platform, user, and directory information.
         """
-        os_name = platform.system()
-        platform_names = {"Darwin": "macOS", "Windows": "Windows", "Linux": "Linux"}
-        platform_name = platform_names.get(os_name, os_name)
-        username = getpass.getuser()
-        home_dir = os.path.expanduser("~")
-        cwd = os.getcwd()
-
         return (
             f"\n\n═══ SYSTEM CONTEXT ═══\n"
-            f"Platform: {platform_name} {platform.release()} ({platform.machine()})\n"
-            f"Username: {username}\n"
-            f"Home Directory: {home_dir}\n"
-            f"Working Directory: {cwd}\n"
+            f"{_static_platform_context()}"
+            f"Working Directory: {os.getcwd()}\n"
             f"═══════════════════════\n"
         )
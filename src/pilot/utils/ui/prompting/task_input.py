@@ -52,7 +52,7 @@ async def get_task_input(
 
     try:
         _print_hud_input_prompt(console)
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         session = get_prompt_session()
         result = await loop.run_in_executor(
             None,
@@ -80,7 +80,7 @@ async def get_voice_input(console: Console) -> Optional[str]:
         console.print(f"  [{THEME['error']}]Failed to start voice input: {error}[/]")
         return None
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     stop_event = asyncio.Event()
 
     def wait_for_enter() -> None:
@@ -0,0 +1,92 @@
+"""
+Tests for the browser agent's download directory scan helpers.
+"""
+
+import os
+from unittest.mock import patch
+
+
+class TestWalkFiles:
+    """Test the scandir-based recursive file walk."""
+
+    def test_walk_files_recurses_into_subdirectories(self, tmp_path):
+        """Files in nested directories should all be yielded."""
+        from pilot.agents.browser_agent import _walk_files
+
+        (tmp_path / "sub" / "deeper").mkdir(parents=True)
+        (tmp_path / "report.pdf").write_bytes(b"pdf")
+        (tmp_path / "sub" / "data.csv").write_bytes(b"a,b")
+        (tmp_path / "sub" / "deeper" / "notes.txt").write_bytes(b"n")
+
+        names = sorted(entry.name for entry in _walk_files(str(tmp_path)))
+
+        assert names == ["data.csv", "notes.txt", "report.pdf"]
+
+    def test_walk_files_does_not_follow_directory_symlinks(self, tmp_path):
+        """A symlinked directory should not pull in files from elsewhere."""
+        from pilot.agents.browser_agent import _walk_files
+
+        outside = tmp_path / "outside"
+        walked = tmp_path / "walked"
+        outside.mkdir()
+        walked.mkdir()
+        (outside / "secret.txt").write_bytes(b"x")
+        os.symlink(outside, walked / "linked_dir")
+
+        assert list(_walk_files(str(walked))) == []
+
+    def test_walk_files_skips_file_symlinks(self, tmp_path):
+        """A symlink to a file is not reported as a file of its own."""
+        from pilot.agents.browser_agent import _walk_files
+
+        (tmp_path / "report.pdf").write_bytes(b"pdf")
+        os.symlink(tmp_path / "report.pdf", tmp_path / "linked.pdf")
+
+        names = [entry.name for entry in _walk_files(str(tmp_path))]
+
+        assert names == ["report.pdf"]
+
+    def test_walk_files_ignores_missing_directory(self, tmp_path):
+        """A directory that disappears before the scan yields nothing."""
+        from pilot.agents.browser_agent import _walk_files
+
+        assert list(_walk_files(str(tmp_path / "missing"))) == []
+
+
+class TestScanDownloads:
+    """Test collection of files across Browser-Use download directories."""
+
+    def test_scan_downloads_collects_every_download_dir(self, tmp_path):
+        """Files from all download dirs are collected with their sizes."""
+        from pilot.agents.browser_agent import _scan_downloads
+
+        first = tmp_path / "browser-use-downloads-a"
+        second = tmp_path / "browser-use-downloads-b"
+        (first / "nested").mkdir(parents=True)
+        second.mkdir()
+        (tmp_path / "unrelated").mkdir()
+        (first / "nested" / "report.pdf").write_bytes(b"12345")
+        (second / "data.csv").write_bytes(b"abc")
+        (tmp_path / "unrelated" / "ignored.txt").write_bytes(b"x")
+
+        with patch(
+            "pilot.agents.browser_agent.tempfile.gettempdir",
+            return_value=str(tmp_path),
+        ):
+            details = _scan_downloads()
+
+        assert sorted((d.name, d.size) for d in details) == [
+            ("data.csv", 3),
+            ("report.pdf", 5),
+        ]
+        assert all(d.path.startswith(str(tmp_path)) for d in details)
+
+    def test_scan_downloads_without_download_dirs(self, tmp_path):
+        """No download directories means no files."""
+        from pilot.agents.browser_agent import _scan_downloads
+
+        with patch(
+            "pilot.agents.browser_agent.tempfile.gettempdir",
+            return_value=str(tmp_path),
+        ):
+            assert _scan_downloads() == []
@@ -0,0 +1,81 @@
+"""
+Tests for FindApplicationTool selection and process caching.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+
+class TestFindApplicationCaching:
+    """Test the selection and process caches on FindApplicationTool."""
+
+    @pytest.fixture
+    def tool(self):
+        """Create a FindApplicationTool backed by a mock LLM."""
+        from pilot.crew_tools.capability_tools import FindApplicationTool
+
+        tool = FindApplicationTool()
+        structured_llm = Mock()
+        structured_llm.invoke = Mock(
+            side_effect=lambda prompt: Mock(selected_app="Safari")
+        )
+        tool._llm = Mock()
+        tool._llm.with_structured_output = Mock(return_value=structured_llm)
+        return tool
+
+    def test_select_app_reuses_answer_for_identical_inputs(self, tool):
+        """The same platform, capability and app list should ask the LLM once."""
+        first = tool._select_app("darwin", "browser", ["Safari", "Finder"])
+        second = tool._select_app("darwin", "browser", ["Safari", "Finder"])
+
+        assert first is second
+        assert tool._get_structured_llm().invoke.call_count == 1
+
+    def test_select_app_evicts_least_recently_used(self, tool):
+        """Past the cache size, the oldest selection should be asked again."""
+        with patch("pilot.crew_tools.capability_tools.SELECTION_CACHE_SIZE", 1):
+            tool._select_app("darwin", "browser", ["Safari"])
+            tool._select_app("darwin", "editor", ["TextEdit"])
+            tool._select_app("darwin", "browser", ["Safari"])
+
+        assert tool._get_structured_llm().invoke.call_count == 3
+
+    def test_select_app_does_not_cache_none(self, tool):
+        """A "NONE" answer should be asked again on the next call."""
+        structured_llm = tool._get_structured_llm()
+        structured_llm.invoke = Mock(return_value=Mock(selected_app="NONE"))
+
+        tool._select_app("darwin", "spreadsheet", ["Finder"])
+        tool._select_app("darwin", "spreadsheet", ["Finder"])
+
+        assert structured_llm.invoke.call_count == 2
+
+    def test_select_app_asks_again_after_llm_swap(self, tool):
+        """Selections cached for one LLM should not be served for another."""
+        first_llm = tool._get_structured_llm()
+        tool._select_app("darwin", "browser", ["Safari"])
+
+        second_llm = Mock()
+        second_llm.invoke = Mock(return_value=Mock(selected_app="Safari"))
+        tool._llm = Mock()
+        tool._llm.with_structured_output = Mock(return_value=second_llm)
+        tool._select_app("darwin", "browser", ["Safari"])
+
+        assert first_llm.invoke.call_count == 1
+        assert second_llm.invoke.call_count == 1
+
+    def test_process_names_shared_within_ttl(self, tool):
+        """Process scans should be reused until PROCESS_NAMES_TTL passes."""
+        process_tool = Mock()
+        process_tool.list_running_processes = Mock(return_value=[{"name": "Finder"}])
+
+        with patch(
+            "pilot.crew_tools.capability_tools.time.monotonic",
+            side_effect=[100.0, 101.0, 103.5],
+        ):
+            assert tool._get_process_names(process_tool) == ["Finder"]
+            assert tool._get_process_names(process_tool) == ["Finder"]
+            assert process_tool.list_running_processes.call_count == 1
+            tool._get_process_names(process_tool)
+
+        assert process_tool.list_running_processes.call_count == 2
@@ -335,6 +335,67 @@ class TestToolOutputCorrectness:
         assert "click" in result.action_taken.lower()
         assert result.method_used == "accessibility_native"
 
+    def test_click_element_ocr_scores_all_text_for_visual_context(self, mock_registry):
+        """An exact OCR hit in the wrong place should not hide a better match."""
+        from src.pilot.crew_tools.gui_interaction_tools import ClickElementTool
+
+        mock_registry.get_tool("accessibility").available = False
+        mock_screenshot = mock_registry.get_tool("screenshot")
+        mock_screenshot.scaling_factor = 1.0
+        mock_screenshot.capture = Mock(return_value=Mock(width=1000, height=1000))
+        top_left = Mock(text="Save", center=(50, 50), confidence=0.9)
+        bottom_right = Mock(text="Save changes", center=(950, 950), confidence=0.9)
+        mock_ocr = mock_registry.get_tool("ocr")
+        mock_ocr.find_text = Mock(return_value=[top_left])
+        mock_ocr.extract_all_text = Mock(return_value=[top_left, bottom_right])
+
+        tool = ClickElementTool()
+        tool._tool_registry = mock_registry
+
+        with patch(
+            "src.pilot.crew_tools.gui_interaction_tools.check_cancellation",
+            return_value=None,
+        ):
+            result = tool._run(
+                target="save",
+                visual_context="bottom right",
+                allow_cursor_fallback=True,
+            )
+
+        assert result.success is True
+        assert result.data["matched_text"] == "Save changes"
+        mock_ocr.extract_all_text.assert_called_once()
+
+    def test_click_element_ocr_prefers_region_over_exact_hit(self, mock_registry):
+        """A partial match in the requested region beats a misplaced exact hit."""
+        from src.pilot.crew_tools.gui_interaction_tools import ClickElementTool
+
+        mock_registry.get_tool("accessibility").available = False
+        mock_screenshot = mock_registry.get_tool("screenshot")
+        mock_screenshot.scaling_factor = 1.0
+        mock_screenshot.capture = Mock(return_value=Mock(width=1000, height=1000))
+        top_right = Mock(text="Save", center=(950, 50), confidence=0.9)
+        bottom_right = Mock(text="Save changes", center=(950, 950), confidence=0.9)
+        mock_ocr = mock_registry.get_tool("ocr")
+        mock_ocr.find_text = Mock(return_value=[top_right])
+        mock_ocr.extract_all_text = Mock(return_value=[top_right, bottom_right])
+
+        tool = ClickElementTool()
+        tool._tool_registry = mock_registry
+
+        with patch(
+            "src.pilot.crew_tools.gui_interaction_tools.check_cancellation",
+            return_value=None,
+        ):
+            result = tool._run(
+                target="save",
+                visual_context="bottom right",
+                allow_cursor_fallback=True,
+            )
+
+        assert result.success is True
+        assert result.data["matched_text"] == "Save changes"
+
     def test_type_text_returns_correct_action(self, mock_registry):
         """TypeTextTool should return action about typing."""
         from src.pilot.crew_tools.gui_interaction_tools import TypeTextTool
@@ -0,0 +1,56 @@
+"""
+Tests for OCRTool recognition reuse across lookups on one frame.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+
+class TestOCRFrameSharing:
+    """Test that OCR lookups on one frame share a single recognition pass."""
+
+    @pytest.fixture
+    def ocr_tool(self):
+        """Create an OCRTool backed by a mock engine."""
+        from pilot.tools.vision.ocr_tool import OCRTool
+
+        with patch.object(OCRTool, "_initialize_engine"):
+            tool = OCRTool()
+        engine = Mock()
+        engine.recognize_text = Mock(
+            return_value=[
+                Mock(text="Save", bounds=(0, 0, 10, 10), center=(5, 5), confidence=0.9)
+            ]
+        )
+        tool.fallback_engines = [engine]
+        return tool
+
+    def test_find_text_and_extract_all_text_share_one_pass(self, ocr_tool):
+        """Exact, fuzzy and full-text lookups on one frame should OCR once."""
+        from PIL import Image
+
+        frame = Image.new("RGB", (64, 64))
+
+        ocr_tool.find_text(frame, "Save", fuzzy=False)
+        ocr_tool.find_text(frame, "Sav", fuzzy=True)
+        ocr_tool.extract_all_text(frame)
+
+        assert ocr_tool.fallback_engines[0].recognize_text.call_count == 1
+
+    def test_find_text_reruns_ocr_for_a_new_frame(self, ocr_tool):
+        """Identical-looking frames are distinct captures and are OCRed again."""
+        from PIL import Image
+
+        ocr_tool.find_text(Image.new("RGB", (64, 64)), "Save")
+        ocr_tool.find_text(Image.new("RGB", (64, 64)), "Save")
+
+        assert ocr_tool.fallback_engines[0].recognize_text.call_count == 2
+
+    def test_clear_cache_releases_the_frame(self, ocr_tool):
+        """clear_cache drops the reference to the last recognized frame."""
+        from PIL import Image
+
+        ocr_tool.find_text(Image.new("RGB", (64, 64)), "Save")
+        ocr_tool.clear_cache()
+
+        assert ocr_tool._frame is None
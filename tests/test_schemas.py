@@ -0,0 +1,33 @@
+"""
+Tests for typed schema models.
+"""
+
+
+class TestBrowserOutputFiles:
+    """Test that BrowserOutput derives its file list from file_details."""
+
+    def test_files_is_computed_from_file_details(self):
+        """files should mirror file_details paths and appear in model_dump."""
+        from pilot.schemas.browser_output import BrowserOutput, FileDetail
+
+        output = BrowserOutput(
+            text="Downloaded report",
+            file_details=[
+                FileDetail(path="/tmp/a/report.pdf", name="report.pdf", size=2048),
+                FileDetail(path="/tmp/a/data.csv", name="data.csv", size=1024),
+            ],
+        )
+
+        assert output.files == ["/tmp/a/report.pdf", "/tmp/a/data.csv"]
+        assert output.model_dump()["files"] == output.files
+        assert output.get_file_count() == 2
+        assert output.get_total_size_kb() == 3.0
+
+    def test_files_defaults_to_empty(self):
+        """Without file details there are no files."""
+        from pilot.schemas.browser_output import BrowserOutput
+
+        output = BrowserOutput(text="Nothing downloaded")
+
+        assert output.files == []
+        assert output.has_files() is False
@@ -0,0 +1,34 @@
+"""
+Tests for ScreenshotTool screen stability detection.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from PIL import Image
+
+
+class TestWaitUntilStable:
+    """Test that wait_until_stable returns once the screen settles."""
+
+    @pytest.fixture
+    def screenshot_tool(self):
+        """Create a ScreenshotTool without touching the display."""
+        from pilot.tools.system.screenshot_tool import ScreenshotTool
+
+        with patch.object(ScreenshotTool, "_detect_scaling", return_value=1.0):
+            return ScreenshotTool()
+
+    def test_returns_after_change_settles(self, screenshot_tool):
+        """A change followed by a repeated frame should end the wait early."""
+        before = Image.new("RGB", (64, 64), "white")
+        after = Image.new("RGB", (64, 64), "black")
+        screenshot_tool.capture = Mock(side_effect=[before, after, after])
+
+        assert screenshot_tool.wait_until_stable(timeout=5.0, poll_interval=0)
+        assert screenshot_tool.capture.call_count == 3
+
+    def test_times_out_without_change(self, screenshot_tool):
+        """An unchanged screen should wait out the timeout and return False."""
+        screenshot_tool.capture = Mock(return_value=Image.new("RGB", (64, 64)))
+
+        assert not screenshot_tool.wait_until_stable(timeout=0.05, poll_interval=0.01)